@@ -1,38 +1,108 @@
-from sqlmodel import SQLModel, Field, Relationship, JSON, Column
+import hashlib
+
+from sqlalchemy import BigInteger, DateTime, Index, Integer, LargeBinary, Sequence as SASequence, func, insert, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from pydantic import TypeAdapter
+from sqlmodel._compat import SQLModelConfig
+from sqlmodel import SQLModel, Field, Relationship, JSON, Column, Session
 from datetime import datetime
-from decimal import Decimal
-from typing import Optional, List, Dict, Any
+from decimal import ROUND_HALF_UP, Decimal
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Mapping, Self, Sequence, TypeVar
 from enum import Enum
 
 
+def _server_timestamp_column(onupdate: bool = False, primary_key: bool = False) -> Column:
+    """Timestamp column defaulted by the database instead of datetime.utcnow().
+
+    Skips two Python datetime constructions per inserted row and keeps bulk
+    INSERT/COPY paths free of per-row parameter binding for timestamps.
+    primary_key is used by the range-partitioned tables, where Postgres
+    requires the partition key to be part of the primary key.
+    """
+    return Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now() if onupdate else None,
+        nullable=False,
+        primary_key=primary_key,
+    )
+
+
+def _partition_id_column(sequence_name: str) -> Column:
+    """Sequence-backed id for the range-partitioned tables.
+
+    Their primary key is composite (id + partition key), which disables the
+    implicit integer autoincrement, so the id draws from an explicit sequence
+    on backends that support one.
+    """
+    return Column(Integer, SASequence(sequence_name), primary_key=True)
+
+
+def _json_column() -> Column:
+    """JSON column stored as JSONB on Postgres (binary form, no reparse on read)."""
+    return Column(JSON().with_variant(JSONB(), "postgresql"))
+
+
+def _money_column() -> Column:
+    """Money stored as integer cents; int arithmetic and SUM beat per-row Decimal."""
+    return Column(BigInteger, nullable=False)
+
+
+def to_cents(amount: Decimal) -> int:
+    """Convert a Decimal amount to integer cents for storage (half-up on sub-cent input)."""
+    return int((amount * 100).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def from_cents(cents: int) -> Decimal:
+    """Convert stored integer cents back to a two-decimal amount at the API boundary."""
+    return Decimal(cents) / 100
+
+
+_E = TypeVar("_E", bound="ValueLookupEnum")
+
+
+class ValueLookupEnum(str, Enum):
+    """str Enum with a direct value lookup for row-hydration hot loops.
+
+    ``cls.from_value(x)`` is a single dict lookup into ``_value2member_map_``,
+    skipping the EnumType ``__call__`` dispatch that ``cls(x)`` goes through.
+    Raises KeyError for unknown values.
+    """
+
+    @classmethod
+    def from_value(cls: type[_E], value: str) -> _E:
+        return cls._value2member_map_[value]  # type: ignore[return-value]
+
+
 # Enums for various status and role types
-class UserRole(str, Enum):
+class UserRole(ValueLookupEnum):
     ADMIN = "admin"
     OPERATOR = "operator"
     MONITORING = "monitoring"
 
 
-class PaymentStatus(str, Enum):
+class PaymentStatus(ValueLookupEnum):
     PAID = "paid"
     PENDING = "pending"
     EXPIRED = "expired"
     FAILED = "failed"
 
 
-class PaymentMethod(str, Enum):
+class PaymentMethod(ValueLookupEnum):
     QRIS = "qris"
     VIRTUAL_ACCOUNT = "virtual_account"
     BANK_TRANSFER = "bank_transfer"
 
 
-class DeviceStatus(str, Enum):
+class DeviceStatus(ValueLookupEnum):
     ACTIVE = "active"
     DOWN = "down"
     ERROR = "error"
     MAINTENANCE = "maintenance"
 
 
-class DeviceType(str, Enum):
+class DeviceType(ValueLookupEnum):
     OLT = "olt"
     ODC = "odc"
     ODP = "odp"
@@ -40,12 +110,12 @@ class DeviceType(str, Enum):
     MIKROTIK = "mikrotik"
 
 
-class ConnectionType(str, Enum):
+class ConnectionType(ValueLookupEnum):
     PPPOE = "pppoe"
     HOTSPOT = "hotspot"
 
 
-class AlarmSeverity(str, Enum):
+class AlarmSeverity(ValueLookupEnum):
     CRITICAL = "critical"
     MAJOR = "major"
     MINOR = "minor"
@@ -53,14 +123,55 @@ class AlarmSeverity(str, Enum):
     INFO = "info"
 
 
-class NotificationType(str, Enum):
+class NotificationType(ValueLookupEnum):
     TELEGRAM = "telegram"
     WHATSAPP = "whatsapp"
     EMAIL = "email"
 
 
+# Plain value -> member dicts for bulk hydration loops that resolve many enum
+# values at once (one C-level dict lookup per value, no classmethod dispatch)
+ENUM_VALUE_MAPS: Dict[type[ValueLookupEnum], Dict[str, ValueLookupEnum]] = {
+    enum_cls: {member.value: member for member in enum_cls}
+    for enum_cls in (
+        UserRole,
+        PaymentStatus,
+        PaymentMethod,
+        DeviceStatus,
+        DeviceType,
+        ConnectionType,
+        AlarmSeverity,
+        NotificationType,
+    )
+}
+
+
+class FastConstructMixin:
+    """Hydrate table models from trusted DB rows without re-running validation.
+
+    Rows coming back from a SELECT are already correctly typed by the DBAPI
+    (datetime/Decimal/JSON columns included), so the Pydantic validation pass is
+    pure overhead on list endpoints. Only works with column-keyed row mappings,
+    i.e. Core-style selects against the table::
+
+        [X.construct_from_mapping(r._mapping) for r in session.execute(select(X.__table__))]
+
+    An ORM-entity ``select(X)`` will NOT do: there ``r._mapping`` is keyed by
+    the entity (``{"X": instance}``), so every field falls back to its default.
+    """
+
+    if TYPE_CHECKING:
+        # provided by the SQLModel side of every concrete subclass
+        @classmethod
+        def model_construct(cls, _fields_set: Optional[set[str]] = None, **values: Any) -> Self: ...
+
+    @classmethod
+    def construct_from_mapping(cls, mapping: Mapping[Any, Any]) -> Self:
+        return cls.model_construct(**mapping)
+
+
 # User and Authentication Models
-class User(SQLModel, table=True):
+class User(FastConstructMixin, SQLModel, table=True):
     __tablename__ = "users"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -71,29 +182,39 @@ class User(SQLModel, table=True):
     role: UserRole = Field(default=UserRole.MONITORING)
     is_active: bool = Field(default=True)
     last_login: Optional[datetime] = Field(default=None)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp_column(onupdate=True))
 
     # Relationships
     activity_logs: List["ActivityLog"] = Relationship(back_populates="user")
+    # cold path: loading this accidentally from a list endpoint is an N+1 bug,
+    # so force callers to eager-load explicitly
     created_customers: List["Customer"] = Relationship(
-        back_populates="created_by", sa_relationship_kwargs={"foreign_keys": "[Customer.created_by_id]"}
+        back_populates="created_by",
+        sa_relationship_kwargs={"foreign_keys": "[Customer.created_by_id]", "lazy": "raise_on_sql"},
     )
 
 
-class JWTToken(SQLModel, table=True):
+class JWTToken(FastConstructMixin, SQLModel, table=True):
     __tablename__ = "jwt_tokens"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id")
-    token_hash: str = Field(max_length=255)
+    # raw SHA-256 digest: binary equality beats varchar collation on the
+    # per-request auth lookup, and the index rows are half the size
+    token_hash: bytes = Field(sa_column=Column(LargeBinary(32), unique=True, index=True, nullable=False))
     expires_at: datetime
     is_revoked: bool = Field(default=False)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp_column())
+
+    @staticmethod
+    def hash_token(token: str) -> bytes:
+        """Digest a presented token for storage/lookup (32 B vs 64 hex chars)."""
+        return hashlib.sha256(token.encode()).digest()
 
 
 # Customer and Billing Models
-class Customer(SQLModel, table=True):
+class Customer(FastConstructMixin, SQLModel, table=True):
     __tablename__ = "customers"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -105,20 +226,26 @@ class Customer(SQLModel, table=True):
     connection_type: ConnectionType
     is_active: bool = Field(default=True)
     created_by_id: int = Field(foreign_key="users.id")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp_column(onupdate=True))
 
     # Relationships
     created_by: User = Relationship(
         back_populates="created_customers", sa_relationship_kwargs={"foreign_keys": "[Customer.created_by_id]"}
     )
-    subscriptions: List["CustomerSubscription"] = Relationship(back_populates="customer")
-    payments: List["Payment"] = Relationship(back_populates="customer")
-    pppoe_sessions: List["PPPoESession"] = Relationship(back_populates="customer")
-    hotspot_sessions: List["HotspotSession"] = Relationship(back_populates="customer")
+    subscriptions: List["CustomerSubscription"] = Relationship(
+        back_populates="customer", sa_relationship_kwargs={"lazy": "selectin"}
+    )
+    payments: List["Payment"] = Relationship(back_populates="customer", sa_relationship_kwargs={"lazy": "selectin"})
+    pppoe_sessions: List["PPPoESession"] = Relationship(
+        back_populates="customer", sa_relationship_kwargs={"lazy": "selectin"}
+    )
+    hotspot_sessions: List["HotspotSession"] = Relationship(
+        back_populates="customer", sa_relationship_kwargs={"lazy": "selectin"}
+    )
 
 
-class InternetPackage(SQLModel, table=True):
+class InternetPackage(FastConstructMixin, SQLModel, table=True):
     __tablename__ = "internet_packages"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -127,17 +254,21 @@ class InternetPackage(SQLModel, table=True):
     connection_type: ConnectionType
     bandwidth_up: int = Field(description="Upload bandwidth in Mbps")
     bandwidth_down: int = Field(description="Download bandwidth in Mbps")
-    price: Decimal = Field(max_digits=10, decimal_places=2)
+    price_cents: int = Field(sa_column=_money_column())
     validity_days: int = Field(default=30)
     is_active: bool = Field(default=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp_column(onupdate=True))
 
     # Relationships
     subscriptions: List["CustomerSubscription"] = Relationship(back_populates="package")
 
+    @property
+    def price(self) -> Decimal:
+        return from_cents(self.price_cents)
+
 
-class CustomerSubscription(SQLModel, table=True):
+class CustomerSubscription(FastConstructMixin, SQLModel, table=True):
     __tablename__ = "customer_subscriptions"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -146,35 +277,40 @@ class CustomerSubscription(SQLModel, table=True):
     start_date: datetime
     end_date: datetime
     is_active: bool = Field(default=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp_column())
 
     # Relationships
     customer: Customer = Relationship(back_populates="subscriptions")
     package: InternetPackage = Relationship(back_populates="subscriptions")
-    invoices: List["Invoice"] = Relationship(back_populates="subscription")
+    invoices: List["Invoice"] = Relationship(back_populates="subscription", sa_relationship_kwargs={"lazy": "selectin"})
 
 
 # Payment and Xendit Integration Models
-class Invoice(SQLModel, table=True):
+class Invoice(FastConstructMixin, SQLModel, table=True):
     __tablename__ = "invoices"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_invoice_status_due", "status", "due_date"),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     invoice_number: str = Field(unique=True, max_length=50)
     subscription_id: int = Field(foreign_key="customer_subscriptions.id")
     xendit_invoice_id: Optional[str] = Field(default=None, max_length=100)
-    amount: Decimal = Field(max_digits=10, decimal_places=2)
+    amount_cents: int = Field(sa_column=_money_column())
     status: PaymentStatus = Field(default=PaymentStatus.PENDING)
     due_date: datetime
-    issued_date: datetime = Field(default_factory=datetime.utcnow)
+    issued_date: Optional[datetime] = Field(default=None, sa_column=_server_timestamp_column())
     paid_date: Optional[datetime] = Field(default=None)
-    xendit_data: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
+    xendit_data: Dict[str, Any] = Field(default={}, sa_column=_json_column())
 
     # Relationships
     subscription: CustomerSubscription = Relationship(back_populates="invoices")
-    payments: List["Payment"] = Relationship(back_populates="invoice")
+    payments: List["Payment"] = Relationship(back_populates="invoice", sa_relationship_kwargs={"lazy": "selectin"})
 
+    @property
+    def amount(self) -> Decimal:
+        return from_cents(self.amount_cents)
 
-class Payment(SQLModel, table=True):
+
+class Payment(FastConstructMixin, SQLModel, table=True):
     __tablename__ = "payments"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -182,21 +318,25 @@ class Payment(SQLModel, table=True):
     customer_id: int = Field(foreign_key="customers.id")
     invoice_id: int = Field(foreign_key="invoices.id")
     xendit_payment_id: Optional[str] = Field(default=None, max_length=100)
-    amount: Decimal = Field(max_digits=10, decimal_places=2)
+    amount_cents: int = Field(sa_column=_money_column())
     payment_method: PaymentMethod
     status: PaymentStatus = Field(default=PaymentStatus.PENDING)
     payment_date: Optional[datetime] = Field(default=None)
-    xendit_webhook_data: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    xendit_webhook_data: Dict[str, Any] = Field(default={}, sa_column=_json_column())
+    created_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp_column(onupdate=True))
 
     # Relationships
     customer: Customer = Relationship(back_populates="payments")
     invoice: Invoice = Relationship(back_populates="payments")
 
+    @property
+    def amount(self) -> Decimal:
+        return from_cents(self.amount_cents)
+
 
 # Network Device Models
-class NetworkDevice(SQLModel, table=True):
+class NetworkDevice(FastConstructMixin, SQLModel, table=True):
     __tablename__ = "network_devices"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -209,21 +349,14 @@ class NetworkDevice(SQLModel, table=True):
     longitude: Optional[Decimal] = Field(default=None, max_digits=11, decimal_places=8)
     status: DeviceStatus = Field(default=DeviceStatus.ACTIVE)
     parent_device_id: Optional[int] = Field(default=None, foreign_key="network_devices.id")
-    snmp_community: Optional[str] = Field(default=None, max_length=50)
-    snmp_port: int = Field(default=161)
-    api_username: Optional[str] = Field(default=None, max_length=50)
-    api_password: Optional[str] = Field(default=None, max_length=100)
-    api_port: Optional[int] = Field(default=None)
-    firmware_version: Optional[str] = Field(default=None, max_length=50)
     model: Optional[str] = Field(default=None, max_length=100)
-    serial_number: Optional[str] = Field(default=None, max_length=100)
     last_seen: Optional[datetime] = Field(default=None)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp_column(onupdate=True))
 
     # Relationships
     child_devices: List["NetworkDevice"] = Relationship(
-        back_populates="parent_device", sa_relationship_kwargs={"remote_side": "[NetworkDevice.id]"}
+        back_populates="parent_device", sa_relationship_kwargs={"lazy": "selectin", "join_depth": 3}
     )
     parent_device: Optional["NetworkDevice"] = Relationship(
         back_populates="child_devices", sa_relationship_kwargs={"remote_side": "[NetworkDevice.id]"}
@@ -231,15 +364,44 @@ class NetworkDevice(SQLModel, table=True):
     device_connections: List["DeviceConnection"] = Relationship(
         back_populates="from_device", sa_relationship_kwargs={"foreign_keys": "[DeviceConnection.from_device_id]"}
     )
+    # never traversed from this side; raise instead of silently emitting a lazy load
     incoming_connections: List["DeviceConnection"] = Relationship(
-        back_populates="to_device", sa_relationship_kwargs={"foreign_keys": "[DeviceConnection.to_device_id]"}
+        back_populates="to_device",
+        sa_relationship_kwargs={"foreign_keys": "[DeviceConnection.to_device_id]", "lazy": "raise_on_sql"},
+    )
+    # one-directional: TrafficMonitor is ingest-only and carries no back-reference
+    traffic_monitors: List["TrafficMonitor"] = Relationship(sa_relationship_kwargs={"lazy": "selectin"})
+    device_alarms: List["DeviceAlarm"] = Relationship(
+        back_populates="device", sa_relationship_kwargs={"lazy": "selectin"}
     )
-    traffic_monitors: List["TrafficMonitor"] = Relationship(back_populates="device")
-    device_alarms: List["DeviceAlarm"] = Relationship(back_populates="device")
     pppoe_sessions: List["PPPoESession"] = Relationship(back_populates="device")
+    credentials: Optional["NetworkDeviceCredentials"] = Relationship(back_populates="device")
+
+
+class NetworkDeviceCredentials(FastConstructMixin, SQLModel, table=True):
+    """Cold half of NetworkDevice (1:1): access credentials and inventory data.
+
+    These columns are only touched when an SNMP/API call is made, so keeping
+    them out of network_devices makes the dashboard's device listing read
+    narrower rows and pack more of the hot table per page.
+    """
+
+    __tablename__ = "network_device_credentials"  # type: ignore[assignment]
+
+    device_id: Optional[int] = Field(default=None, foreign_key="network_devices.id", primary_key=True)
+    snmp_community: Optional[str] = Field(default=None, max_length=50)
+    snmp_port: int = Field(default=161)
+    api_username: Optional[str] = Field(default=None, max_length=50)
+    api_password: Optional[str] = Field(default=None, max_length=100)
+    api_port: Optional[int] = Field(default=None)
+    firmware_version: Optional[str] = Field(default=None, max_length=50)
+    serial_number: Optional[str] = Field(default=None, max_length=100)
+
+    # Relationships
+    device: NetworkDevice = Relationship(back_populates="credentials")
 
 
-class DeviceConnection(SQLModel, table=True):
+class DeviceConnection(FastConstructMixin, SQLModel, table=True):
     __tablename__ = "device_connections"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -249,7 +411,7 @@ class DeviceConnection(SQLModel, table=True):
     port_from: Optional[str] = Field(default=None, max_length=20)
     port_to: Optional[str] = Field(default=None, max_length=20)
     is_active: bool = Field(default=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp_column())
 
     # Relationships
     from_device: NetworkDevice = Relationship(
@@ -263,8 +425,21 @@ class DeviceConnection(SQLModel, table=True):
 
 
 # Session Management Models
-class PPPoESession(SQLModel, table=True):
+class PPPoESession(FastConstructMixin, SQLModel, table=True):
     __tablename__ = "pppoe_sessions"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_pppoe_customer_active", "customer_id", "is_active"),
+        Index("ix_pppoe_device_active", "device_id", "is_active"),
+        # covering index: the "top talkers" dashboard reads only the counters,
+        # so on Postgres this becomes an index-only scan
+        Index(
+            "ix_pppoe_active_counters",
+            "is_active",
+            "customer_id",
+            postgresql_include=["bytes_in", "bytes_out", "uptime"],
+        ),
+        Index("ux_pppoe_session", "username", "session_id", unique=True),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     username: str = Field(max_length=100)
@@ -273,60 +448,120 @@ class PPPoESession(SQLModel, table=True):
     session_id: str = Field(max_length=100)
     ip_address: Optional[str] = Field(default=None, max_length=45)
     mac_address: Optional[str] = Field(default=None, max_length=17)
-    uptime: Optional[int] = Field(default=None, description="Session uptime in seconds")
-    bytes_in: Optional[int] = Field(default=None)
-    bytes_out: Optional[int] = Field(default=None)
+    uptime: Optional[int] = Field(default=None, sa_column=Column(BigInteger), description="Session uptime in seconds")
+    bytes_in: Optional[int] = Field(default=None, sa_column=Column(BigInteger))
+    bytes_out: Optional[int] = Field(default=None, sa_column=Column(BigInteger))
     is_active: bool = Field(default=True)
-    start_time: datetime = Field(default_factory=datetime.utcnow)
+    start_time: Optional[datetime] = Field(default=None, sa_column=_server_timestamp_column())
     end_time: Optional[datetime] = Field(default=None)
-    last_update: datetime = Field(default_factory=datetime.utcnow)
+    last_update: Optional[datetime] = Field(default=None, sa_column=_server_timestamp_column(onupdate=True))
 
     # Relationships
     customer: Customer = Relationship(back_populates="pppoe_sessions")
     device: NetworkDevice = Relationship(back_populates="pppoe_sessions")
 
-
-class HotspotSession(SQLModel, table=True):
+    @classmethod
+    def upsert(cls, session: Session, values: Dict[str, Any]) -> None:
+        """Apply a RADIUS accounting update in a single round trip.
+
+        INSERT ... ON CONFLICT DO UPDATE against the (username, session_id)
+        unique index replaces the SELECT-then-INSERT/UPDATE dance; on conflict
+        every non-key column present in values is refreshed from EXCLUDED
+        (columns not passed keep their stored value), plus last_update.
+        Postgres only.
+        """
+        statement = pg_insert(cls.__table__).values(**values)  # type: ignore[attr-defined]
+        updatable = [key for key in values if key not in ("username", "session_id")]
+        statement = statement.on_conflict_do_update(
+            index_elements=["username", "session_id"],
+            set_={**{key: statement.excluded[key] for key in updatable}, "last_update": func.now()},
+        )
+        session.execute(statement)
+
+
+class HotspotSession(FastConstructMixin, SQLModel, table=True):
     __tablename__ = "hotspot_sessions"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_hotspot_customer_active", "customer_id", "is_active"),
+        Index(
+            "ix_hotspot_active_counters",
+            "is_active",
+            "customer_id",
+            postgresql_include=["bytes_in", "bytes_out", "uptime"],
+        ),
+        Index("ux_hotspot_session", "username", "mac_address", unique=True),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     username: str = Field(max_length=100)
     customer_id: int = Field(foreign_key="customers.id")
     mac_address: str = Field(max_length=17)
     ip_address: Optional[str] = Field(default=None, max_length=45)
-    uptime: Optional[int] = Field(default=None, description="Session uptime in seconds")
-    bytes_in: Optional[int] = Field(default=None)
-    bytes_out: Optional[int] = Field(default=None)
+    uptime: Optional[int] = Field(default=None, sa_column=Column(BigInteger), description="Session uptime in seconds")
+    bytes_in: Optional[int] = Field(default=None, sa_column=Column(BigInteger))
+    bytes_out: Optional[int] = Field(default=None, sa_column=Column(BigInteger))
     is_active: bool = Field(default=True)
-    start_time: datetime = Field(default_factory=datetime.utcnow)
+    start_time: Optional[datetime] = Field(default=None, sa_column=_server_timestamp_column())
     end_time: Optional[datetime] = Field(default=None)
-    last_update: datetime = Field(default_factory=datetime.utcnow)
+    last_update: Optional[datetime] = Field(default=None, sa_column=_server_timestamp_column(onupdate=True))
 
     # Relationships
     customer: Customer = Relationship(back_populates="hotspot_sessions")
 
+    @classmethod
+    def upsert(cls, session: Session, values: Dict[str, Any]) -> None:
+        """Apply an accounting update in a single round trip.
+
+        Same pattern as PPPoESession.upsert, keyed on the
+        (username, mac_address) unique index. Postgres only.
+        """
+        statement = pg_insert(cls.__table__).values(**values)  # type: ignore[attr-defined]
+        updatable = [key for key in values if key not in ("username", "mac_address")]
+        statement = statement.on_conflict_do_update(
+            index_elements=["username", "mac_address"],
+            set_={**{key: statement.excluded[key] for key in updatable}, "last_update": func.now()},
+        )
+        session.execute(statement)
+
 
 # Monitoring and Traffic Models
-class TrafficMonitor(SQLModel, table=True):
+class TrafficMonitor(FastConstructMixin, SQLModel, table=True):
     __tablename__ = "traffic_monitors"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_traffic_dev_time", "device_id", text("timestamp DESC")),
+        # no RETURNING on the ingest path: it forces per-row round trips in executemany
+        {"postgresql_partition_by": "RANGE (timestamp)", "implicit_returning": False},
+    )
 
-    id: Optional[int] = Field(default=None, primary_key=True)
+    id: Optional[int] = Field(default=None, sa_column=_partition_id_column("traffic_monitors_id_seq"))
     device_id: int = Field(foreign_key="network_devices.id")
     interface_name: str = Field(max_length=50)
-    bytes_in: int = Field(default=0)
-    bytes_out: int = Field(default=0)
-    packets_in: int = Field(default=0)
-    packets_out: int = Field(default=0)
-    errors_in: int = Field(default=0)
-    errors_out: int = Field(default=0)
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
-
-    # Relationships
-    device: NetworkDevice = Relationship(back_populates="traffic_monitors")
-
-
-class DeviceAlarm(SQLModel, table=True):
+    bytes_in: int = Field(default=0, sa_column=Column(BigInteger, default=0, nullable=False))
+    bytes_out: int = Field(default=0, sa_column=Column(BigInteger, default=0, nullable=False))
+    packets_in: int = Field(default=0, sa_column=Column(BigInteger, default=0, nullable=False))
+    packets_out: int = Field(default=0, sa_column=Column(BigInteger, default=0, nullable=False))
+    errors_in: int = Field(default=0, sa_column=Column(BigInteger, default=0, nullable=False))
+    errors_out: int = Field(default=0, sa_column=Column(BigInteger, default=0, nullable=False))
+    timestamp: Optional[datetime] = Field(default=None, sa_column=_server_timestamp_column(primary_key=True))
+
+    @classmethod
+    def bulk_insert(cls, session: Session, samples: Sequence[Dict[str, Any]]) -> None:
+        """Insert a batch of samples with a single Core executemany.
+
+        The SNMP poller produces one row per device per interface per tick;
+        going through the ORM would pay instance construction, identity-map
+        insertion and per-row flush for rows that are never read back.
+        Timestamps come from the table's server default. All sample dicts in
+        one batch must share the same keys (executemany semantics).
+        """
+        if not samples:
+            return
+        session.execute(insert(cls.__table__), list(samples))  # type: ignore[attr-defined]
+
+
+class DeviceAlarm(FastConstructMixin, SQLModel, table=True):
     __tablename__ = "device_alarms"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_alarm_open", "severity", "is_acknowledged", "resolved"),)
 
     id: Optional[int] = Field(default=None, primary_key=True)
     device_id: int = Field(foreign_key="network_devices.id")
@@ -338,18 +573,19 @@ class DeviceAlarm(SQLModel, table=True):
     acknowledged_at: Optional[datetime] = Field(default=None)
     resolved: bool = Field(default=False)
     resolved_at: Optional[datetime] = Field(default=None)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp_column(onupdate=True))
 
     # Relationships
     device: NetworkDevice = Relationship(back_populates="device_alarms")
 
 
 # System Logging Models
-class ActivityLog(SQLModel, table=True):
+class ActivityLog(FastConstructMixin, SQLModel, table=True):
     __tablename__ = "activity_logs"  # type: ignore[assignment]
+    __table_args__ = {"postgresql_partition_by": "RANGE (created_at)", "implicit_returning": False}
 
-    id: Optional[int] = Field(default=None, primary_key=True)
+    id: Optional[int] = Field(default=None, sa_column=_partition_id_column("activity_logs_id_seq"))
     user_id: int = Field(foreign_key="users.id")
     action: str = Field(max_length=100)
     resource_type: str = Field(max_length=50)
@@ -357,26 +593,27 @@ class ActivityLog(SQLModel, table=True):
     description: str = Field(max_length=500)
     ip_address: Optional[str] = Field(default=None, max_length=45)
     user_agent: Optional[str] = Field(default=None, max_length=500)
-    additional_data: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    additional_data: Dict[str, Any] = Field(default={}, sa_column=_json_column())
+    created_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp_column(primary_key=True))
 
     # Relationships
     user: User = Relationship(back_populates="activity_logs")
 
 
-class SystemLog(SQLModel, table=True):
+class SystemLog(FastConstructMixin, SQLModel, table=True):
     __tablename__ = "system_logs"  # type: ignore[assignment]
+    __table_args__ = {"postgresql_partition_by": "RANGE (timestamp)", "implicit_returning": False}
 
-    id: Optional[int] = Field(default=None, primary_key=True)
+    id: Optional[int] = Field(default=None, sa_column=_partition_id_column("system_logs_id_seq"))
     level: str = Field(max_length=20)
     source: str = Field(max_length=100)
     message: str = Field(max_length=1000)
     error_details: Optional[str] = Field(default=None, max_length=2000)
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: Optional[datetime] = Field(default=None, sa_column=_server_timestamp_column(primary_key=True))
 
 
 # Notification Models
-class NotificationTemplate(SQLModel, table=True):
+class NotificationTemplate(FastConstructMixin, SQLModel, table=True):
     __tablename__ = "notification_templates"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -385,12 +622,13 @@ class NotificationTemplate(SQLModel, table=True):
     subject: Optional[str] = Field(default=None, max_length=200)
     template: str = Field(max_length=2000)
     is_active: bool = Field(default=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp_column())
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp_column(onupdate=True))
 
 
-class NotificationQueue(SQLModel, table=True):
+class NotificationQueue(FastConstructMixin, SQLModel, table=True):
     __tablename__ = "notification_queue"  # type: ignore[assignment]
+    __table_args__ = (Index("ix_notif_pending", "status", "priority", "scheduled_at"), {"implicit_returning": False})
 
     id: Optional[int] = Field(default=None, primary_key=True)
     notification_type: NotificationType
@@ -401,29 +639,35 @@ class NotificationQueue(SQLModel, table=True):
     status: str = Field(default="pending", max_length=20)
     attempts: int = Field(default=0)
     last_attempt: Optional[datetime] = Field(default=None)
-    scheduled_at: datetime = Field(default_factory=datetime.utcnow)
+    scheduled_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp_column())
     sent_at: Optional[datetime] = Field(default=None)
     error_message: Optional[str] = Field(default=None, max_length=500)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp_column())
 
 
 # Webhook Models
-class WebhookLog(SQLModel, table=True):
+class WebhookLog(FastConstructMixin, SQLModel, table=True):
     __tablename__ = "webhook_logs"  # type: ignore[assignment]
+    __table_args__ = (
+        Index("ix_webhook_unproc", "processed", "created_at"),
+        # GIN index so webhook payloads can be queried by arbitrary keys (Postgres only)
+        Index("ix_webhook_payload_gin", "payload", postgresql_using="gin"),
+        {"postgresql_partition_by": "RANGE (created_at)", "implicit_returning": False},
+    )
 
-    id: Optional[int] = Field(default=None, primary_key=True)
+    id: Optional[int] = Field(default=None, sa_column=_partition_id_column("webhook_logs_id_seq"))
     source: str = Field(max_length=50)
     event_type: str = Field(max_length=100)
-    payload: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
-    headers: Dict[str, Any] = Field(default={}, sa_column=Column(JSON))
+    payload: Dict[str, Any] = Field(default={}, sa_column=_json_column())
+    headers: Dict[str, Any] = Field(default={}, sa_column=_json_column())
     processed: bool = Field(default=False)
     processing_result: Optional[str] = Field(default=None, max_length=500)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp_column(primary_key=True))
     processed_at: Optional[datetime] = Field(default=None)
 
 
 # Configuration Models
-class SystemConfiguration(SQLModel, table=True):
+class SystemConfiguration(FastConstructMixin, SQLModel, table=True):
     __tablename__ = "system_configurations"  # type: ignore[assignment]
 
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -431,11 +675,18 @@ class SystemConfiguration(SQLModel, table=True):
     value: str = Field(max_length=2000)
     description: Optional[str] = Field(default=None, max_length=500)
     is_encrypted: bool = Field(default=False)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: Optional[datetime] = Field(default=None, sa_column=_server_timestamp_column(onupdate=True))
+
+
+# Non-persistent schemas for validation and API. Frozen with extra="forbid":
+# pydantic then uses a fixed attribute layout and a stricter, faster validator,
+# and unknown keys in inbound payloads fail instead of being silently kept.
+_DTO_CONFIG = SQLModelConfig(frozen=True, extra="forbid")
 
 
-# Non-persistent schemas for validation and API
 class UserCreate(SQLModel, table=False):
+    model_config = _DTO_CONFIG
+
     username: str = Field(max_length=50)
     email: str = Field(max_length=255)
     password: str = Field(min_length=8, max_length=100)
@@ -444,6 +695,8 @@ class UserCreate(SQLModel, table=False):
 
 
 class UserUpdate(SQLModel, table=False):
+    model_config = _DTO_CONFIG
+
     username: Optional[str] = Field(default=None, max_length=50)
     email: Optional[str] = Field(default=None, max_length=255)
     full_name: Optional[str] = Field(default=None, max_length=100)
@@ -452,6 +705,8 @@ class UserUpdate(SQLModel, table=False):
 
 
 class CustomerCreate(SQLModel, table=False):
+    model_config = _DTO_CONFIG
+
     customer_code: str = Field(max_length=20)
     name: str = Field(max_length=100)
     email: Optional[str] = Field(default=None, max_length=255)
@@ -461,6 +716,8 @@ class CustomerCreate(SQLModel, table=False):
 
 
 class NetworkDeviceCreate(SQLModel, table=False):
+    model_config = _DTO_CONFIG
+
     name: str = Field(max_length=100)
     device_type: DeviceType
     ip_address: str = Field(max_length=45)
@@ -477,6 +734,8 @@ class NetworkDeviceCreate(SQLModel, table=False):
 
 
 class InternetPackageCreate(SQLModel, table=False):
+    model_config = _DTO_CONFIG
+
     name: str = Field(max_length=100)
     description: str = Field(default="", max_length=500)
     connection_type: ConnectionType
@@ -487,6 +746,8 @@ class InternetPackageCreate(SQLModel, table=False):
 
 
 class PaymentWebhook(SQLModel, table=False):
+    model_config = _DTO_CONFIG
+
     payment_id: str
     status: PaymentStatus
     amount: Decimal
@@ -501,9 +762,22 @@ class DeviceTopologyResponse(SQLModel, table=False):
 
 
 class DashboardStats(SQLModel, table=False):
+    model_config = _DTO_CONFIG
+
     connected_devices: int = Field(default=0)
     active_pppoe_users: int = Field(default=0)
     active_hotspot_users: int = Field(default=0)
     pending_payments: int = Field(default=0)
     critical_alarms: int = Field(default=0)
     total_revenue: Decimal = Field(default=Decimal("0"), max_digits=15, decimal_places=2)
+
+
+# Pre-built batch adapters for list endpoints: one dump_json call serializes the
+# whole result set, instead of paying per-row schema traversal in model_dump.
+# TypeAdapter construction is expensive, so these are created once at import.
+CUSTOMER_LIST_ADAPTER = TypeAdapter(List[Customer])
+PPPOE_SESSION_LIST_ADAPTER = TypeAdapter(List[PPPoESession])
+HOTSPOT_SESSION_LIST_ADAPTER = TypeAdapter(List[HotspotSession])
+NETWORK_DEVICE_LIST_ADAPTER = TypeAdapter(List[NetworkDevice])
+INVOICE_LIST_ADAPTER = TypeAdapter(List[Invoice])
+PAYMENT_LIST_ADAPTER = TypeAdapter(List[Payment])
@@ -0,0 +1,62 @@
+"""Monthly range-partition management for the append-only log tables.
+
+The parent tables are declared with ``postgresql_partition_by`` in app.models,
+which makes create_all emit ``PARTITION BY RANGE (...)`` — but Postgres never
+creates child partitions on its own, so without them every insert fails. This
+module creates the current month's partition plus a lookahead window; retention
+becomes a cheap DROP TABLE of old partitions instead of a slow DELETE.
+"""
+
+from datetime import date
+from logging import getLogger
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+logger = getLogger(__name__)
+
+# table name -> partition key column
+PARTITIONED_TABLES = {
+    "traffic_monitors": "timestamp",
+    "webhook_logs": "created_at",
+    "system_logs": "timestamp",
+    "activity_logs": "created_at",
+}
+
+
+def _month_start(year: int, month: int) -> date:
+    return date(year, month, 1)
+
+
+def _add_months(day: date, months: int) -> date:
+    total = day.year * 12 + (day.month - 1) + months
+    return _month_start(total // 12, total % 12 + 1)
+
+
+def ensure_monthly_partitions(engine: Engine, months_ahead: int = 12) -> None:
+    """Create monthly child partitions for this month through months_ahead.
+
+    The default lookahead of a year covers long-running processes that are only
+    restarted rarely; once a process outlives the provisioned window, inserts
+    fail with "no partition of relation found for row", so redeploy (or call
+    this again from a periodic job) at least once within the window.
+
+    No-op on non-Postgres backends, where the parent tables are plain tables.
+    """
+    if engine.dialect.name != "postgresql":
+        return
+
+    current = _month_start(date.today().year, date.today().month)
+    with engine.begin() as conn:
+        for table_name in PARTITIONED_TABLES:
+            for offset in range(months_ahead + 1):
+                lower = _add_months(current, offset)
+                upper = _add_months(current, offset + 1)
+                partition_name = f"{table_name}_{lower.year}_{lower.month:02d}"
+                conn.execute(
+                    text(
+                        f"CREATE TABLE IF NOT EXISTS {partition_name} PARTITION OF {table_name} "
+                        f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+                    )
+                )
+                logger.debug(f"Ensured partition {partition_name}")
@@ -0,0 +1,49 @@
+"""Reusable buffer pool for batch ingest and drain paths.
+
+The SNMP poller and the notification worker fill a fresh list per batch, many
+times a minute, for the lifetime of the process. Reusing a small fixed set of
+buffers keeps that steady allocation churn away from the GC. Typical use::
+
+    with TRAFFIC_SAMPLE_POOL.buffer() as samples:
+        samples.extend(poll_device(device))
+        TrafficMonitor.bulk_insert(session, samples)
+"""
+
+from contextlib import contextmanager
+from typing import Any, Iterator, List
+
+
+class BufferPool:
+    """Fixed-size pool of reusable list buffers.
+
+    acquire() returns an empty list and release() clears and returns it to the
+    pool; buffers released beyond pool_size are dropped, so overflow under
+    bursts is harmless. Not thread-safe — use one pool per worker.
+    """
+
+    def __init__(self, pool_size: int = 4) -> None:
+        self._pool_size = pool_size
+        self._free: List[List[Any]] = [[] for _ in range(pool_size)]
+
+    def acquire(self) -> List[Any]:
+        if self._free:
+            return self._free.pop()
+        return []
+
+    def release(self, buffer: List[Any]) -> None:
+        if len(self._free) < self._pool_size:
+            buffer.clear()
+            self._free.append(buffer)
+
+    @contextmanager
+    def buffer(self) -> Iterator[List[Any]]:
+        buf = self.acquire()
+        try:
+            yield buf
+        finally:
+            self.release(buf)
+
+
+# Shared pools for the two long-running batch paths
+TRAFFIC_SAMPLE_POOL = BufferPool()
+NOTIFICATION_BATCH_POOL = BufferPool()
@@ -0,0 +1,125 @@
+"""Precompiled SELECT statements for the hottest query paths.
+
+SQLAlchemy's compiled-statement cache only hits when the statement is built from
+the same objects, so assembling a fresh select() per request re-pays Python
+statement construction every time. The statements here are built once at import
+and executed with bound parameters::
+
+    session.execute(USER_BY_USERNAME, {"username": name}).scalar_one_or_none()
+    session.execute(ACTIVE_PPPOE_BY_CUSTOMER, {"customer_id": cid}).scalars().all()
+"""
+
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from sqlalchemy import bindparam
+from sqlmodel import Session, select
+
+from app.models import (
+    AlarmSeverity,
+    DeviceAlarm,
+    DeviceConnection,
+    DeviceTopologyResponse,
+    HotspotSession,
+    Invoice,
+    JWTToken,
+    NetworkDevice,
+    NotificationQueue,
+    PaymentStatus,
+    PPPoESession,
+    User,
+)
+
+# Auth hot path: every authenticated request resolves the user by name
+USER_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+
+# Token validation: pass {"token_hash": JWTToken.hash_token(token), "now": datetime.now(timezone.utc)}
+VALID_TOKEN_BY_HASH = select(JWTToken).where(
+    JWTToken.token_hash == bindparam("token_hash"),
+    JWTToken.is_revoked == False,  # noqa: E712
+    JWTToken.expires_at > bindparam("now"),
+)
+
+# RADIUS/dashboard hot paths
+ACTIVE_PPPOE_BY_CUSTOMER = select(PPPoESession).where(
+    PPPoESession.customer_id == bindparam("customer_id"), PPPoESession.is_active
+)
+ACTIVE_HOTSPOT_BY_CUSTOMER = select(HotspotSession).where(
+    HotspotSession.customer_id == bindparam("customer_id"), HotspotSession.is_active
+)
+
+# Billing dashboard
+PENDING_INVOICES = (
+    select(Invoice).where(Invoice.status == PaymentStatus.PENDING).order_by(Invoice.due_date)  # type: ignore[arg-type]
+)
+
+# Monitoring dashboard: open critical alarms, newest first
+OPEN_CRITICAL_ALARMS = (
+    select(DeviceAlarm)
+    .where(
+        DeviceAlarm.severity == AlarmSeverity.CRITICAL,
+        DeviceAlarm.is_acknowledged == False,  # noqa: E712 - SQL expression, not Python comparison
+        DeviceAlarm.resolved == False,  # noqa: E712
+    )
+    .order_by(DeviceAlarm.created_at.desc())  # type: ignore[union-attr]
+)
+
+# Notification worker: next batch of pending messages in priority order
+PENDING_NOTIFICATIONS = (
+    select(NotificationQueue)
+    .where(NotificationQueue.status == "pending")
+    .order_by(NotificationQueue.priority, NotificationQueue.scheduled_at)  # type: ignore[arg-type]
+    .limit(bindparam("batch_size"))
+)
+
+# Topology: the whole subtree under a root device in one recursive CTE,
+# instead of one query per node when walking child_devices in Python
+_device_tree = select(NetworkDevice).where(NetworkDevice.id == bindparam("root")).cte("device_tree", recursive=True)
+_device_tree = _device_tree.union_all(
+    select(NetworkDevice).join(
+        _device_tree,
+        NetworkDevice.parent_device_id == _device_tree.c.id,  # type: ignore[arg-type]
+    )
+)
+DEVICE_SUBTREE = _device_tree.select()
+
+
+def fetch_device_topology(session: Session, root_device_id: int) -> Optional[DeviceTopologyResponse]:
+    """Build the topology tree for a root device with exactly two queries.
+
+    One recursive CTE fetches the whole subtree, a second query fetches all
+    outgoing connections for those devices; the nesting is then stitched in a
+    single Python pass. Rows are hydrated via construct_from_mapping, so no
+    validation runs on trusted DB data.
+    """
+    device_rows = session.execute(DEVICE_SUBTREE, {"root": root_device_id}).all()
+    if not device_rows:
+        return None
+    devices = [NetworkDevice.construct_from_mapping(row._mapping) for row in device_rows]
+
+    device_ids = [device.id for device in devices]
+    connection_rows = session.execute(
+        select(*DeviceConnection.__table__.c).where(  # type: ignore[attr-defined]
+            DeviceConnection.from_device_id.in_(device_ids)  # type: ignore[attr-defined]
+        )
+    ).all()
+
+    children_map: Dict[Optional[int], List[NetworkDevice]] = defaultdict(list)
+    for device in devices:
+        if device.id != root_device_id:
+            children_map[device.parent_device_id].append(device)
+
+    connections_map: Dict[Optional[int], List[DeviceConnection]] = defaultdict(list)
+    for row in connection_rows:
+        connection = DeviceConnection.construct_from_mapping(row._mapping)
+        connections_map[connection.from_device_id].append(connection)
+
+    def build_node(device: NetworkDevice) -> DeviceTopologyResponse:
+        return DeviceTopologyResponse.model_construct(
+            device=device,
+            children=[build_node(child) for child in children_map.get(device.id, [])],
+            connections=connections_map.get(device.id, []),
+        )
+
+    root = next(device for device in devices if device.id == root_device_id)
+    return build_node(root)
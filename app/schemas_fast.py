@@ -0,0 +1,123 @@
+"""msgspec-based wire schemas for the API hot path.
+
+These mirror the non-persistent ``table=False`` schemas in app.models but skip the
+Pydantic validation machinery: msgspec decodes and validates JSON in a single C pass.
+The SQLModel table classes stay untouched and remain the source of truth for
+persistence; only the wire-facing request/response shapes live here.
+
+Decoders are built once at import time and reused; route handlers should call
+``decode(body, UserCreate)`` on the raw request body and ``encode(obj)`` on responses.
+"""
+
+from decimal import Decimal
+from typing import Annotated, Any, Dict, List, Optional, Type, TypeVar
+
+import msgspec
+
+from app.models import ConnectionType, DeviceType, PaymentMethod, PaymentStatus, UserRole
+
+T = TypeVar("T", bound=msgspec.Struct)
+
+
+class UserCreate(msgspec.Struct, frozen=True):
+    username: Annotated[str, msgspec.Meta(max_length=50)]
+    email: Annotated[str, msgspec.Meta(max_length=255)]
+    password: Annotated[str, msgspec.Meta(min_length=8, max_length=100)]
+    full_name: Annotated[str, msgspec.Meta(max_length=100)]
+    role: UserRole = UserRole.MONITORING
+
+
+class UserUpdate(msgspec.Struct, frozen=True):
+    username: Optional[Annotated[str, msgspec.Meta(max_length=50)]] = None
+    email: Optional[Annotated[str, msgspec.Meta(max_length=255)]] = None
+    full_name: Optional[Annotated[str, msgspec.Meta(max_length=100)]] = None
+    role: Optional[UserRole] = None
+    is_active: Optional[bool] = None
+
+
+class CustomerCreate(msgspec.Struct, frozen=True):
+    customer_code: Annotated[str, msgspec.Meta(max_length=20)]
+    name: Annotated[str, msgspec.Meta(max_length=100)]
+    address: Annotated[str, msgspec.Meta(max_length=500)]
+    connection_type: ConnectionType
+    email: Optional[Annotated[str, msgspec.Meta(max_length=255)]] = None
+    phone: Optional[Annotated[str, msgspec.Meta(max_length=20)]] = None
+
+
+class NetworkDeviceCreate(msgspec.Struct, frozen=True):
+    name: Annotated[str, msgspec.Meta(max_length=100)]
+    device_type: DeviceType
+    ip_address: Annotated[str, msgspec.Meta(max_length=45)]
+    location: Annotated[str, msgspec.Meta(max_length=200)]
+    mac_address: Optional[Annotated[str, msgspec.Meta(max_length=17)]] = None
+    latitude: Optional[Decimal] = None
+    longitude: Optional[Decimal] = None
+    parent_device_id: Optional[int] = None
+    snmp_community: Optional[Annotated[str, msgspec.Meta(max_length=50)]] = None
+    snmp_port: int = 161
+    api_username: Optional[Annotated[str, msgspec.Meta(max_length=50)]] = None
+    api_password: Optional[Annotated[str, msgspec.Meta(max_length=100)]] = None
+    api_port: Optional[int] = None
+
+
+class InternetPackageCreate(msgspec.Struct, frozen=True):
+    name: Annotated[str, msgspec.Meta(max_length=100)]
+    connection_type: ConnectionType
+    bandwidth_up: int
+    bandwidth_down: int
+    price: Decimal
+    description: Annotated[str, msgspec.Meta(max_length=500)] = ""
+    validity_days: int = 30
+
+
+class PaymentWebhook(msgspec.Struct, frozen=True):
+    payment_id: str
+    status: PaymentStatus
+    amount: Decimal
+    payment_method: PaymentMethod
+    webhook_data: Dict[str, Any] = {}
+
+
+class DeviceTopologyResponse(msgspec.Struct, frozen=True):
+    # device and connections are plain mappings here (dumped from the ORM rows);
+    # msgspec encodes them without touching the SQLModel classes
+    device: Dict[str, Any]
+    children: List["DeviceTopologyResponse"] = []
+    connections: List[Dict[str, Any]] = []
+
+
+class DashboardStats(msgspec.Struct, frozen=True):
+    connected_devices: int = 0
+    active_pppoe_users: int = 0
+    active_hotspot_users: int = 0
+    pending_payments: int = 0
+    critical_alarms: int = 0
+    total_revenue: Decimal = Decimal("0")
+
+
+# Decoders are specialized per schema and built once at import time
+DECODERS: Dict[Type[msgspec.Struct], msgspec.json.Decoder] = {
+    schema: msgspec.json.Decoder(schema)
+    for schema in (
+        UserCreate,
+        UserUpdate,
+        CustomerCreate,
+        NetworkDeviceCreate,
+        InternetPackageCreate,
+        PaymentWebhook,
+        DeviceTopologyResponse,
+        DashboardStats,
+    )
+}
+
+ENCODER = msgspec.json.Encoder()
+
+
+def decode(payload: bytes, schema: Type[T]) -> T:
+    """Decode and validate a raw JSON request body into the given schema."""
+    return DECODERS[schema].decode(payload)
+
+
+def encode(obj: Any) -> bytes:
+    """Serialize a response object (Struct or plain containers) to JSON bytes."""
+    return ENCODER.encode(obj)
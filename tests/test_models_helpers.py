@@ -0,0 +1,33 @@
+"""Tests for the non-database helpers in app.models."""
+
+from decimal import Decimal
+
+import pytest
+
+from app.models import ENUM_VALUE_MAPS, PaymentStatus, UserRole, from_cents, to_cents
+
+
+def test_enum_from_value():
+    assert UserRole.from_value("admin") is UserRole.ADMIN
+    assert PaymentStatus.from_value("paid") is PaymentStatus.PAID
+
+
+def test_enum_from_value_unknown():
+    with pytest.raises(KeyError):
+        UserRole.from_value("superuser")
+
+
+def test_enum_value_maps_complete():
+    for enum_cls, value_map in ENUM_VALUE_MAPS.items():
+        assert value_map == {member.value: member for member in enum_cls}
+
+
+def test_cents_round_trip():
+    assert to_cents(Decimal("150000.00")) == 15000000
+    assert from_cents(15000000) == Decimal("150000.00")
+    assert from_cents(to_cents(Decimal("99.99"))) == Decimal("99.99")
+
+
+def test_to_cents_rounds_half_up():
+    assert to_cents(Decimal("0.005")) == 1
+    assert to_cents(Decimal("0.004")) == 0
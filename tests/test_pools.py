@@ -0,0 +1,29 @@
+"""Tests for the reusable buffer pool."""
+
+from app.pools import BufferPool
+
+
+def test_buffer_is_reused_and_cleared():
+    pool = BufferPool(pool_size=1)
+    buf = pool.acquire()
+    buf.append("sample")
+    pool.release(buf)
+    again = pool.acquire()
+    assert again is buf
+    assert again == []
+
+
+def test_overflow_buffers_are_dropped():
+    pool = BufferPool(pool_size=1)
+    first, second = pool.acquire(), pool.acquire()
+    pool.release(first)
+    pool.release(second)
+    assert pool.acquire() is first
+    assert pool.acquire() is not second
+
+
+def test_context_manager_releases():
+    pool = BufferPool(pool_size=1)
+    with pool.buffer() as buf:
+        buf.append(1)
+    assert pool.acquire() is buf
@@ -0,0 +1,57 @@
+"""Tests for the precompiled topology query."""
+
+import pytest
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.models import DeviceConnection, DeviceType, NetworkDevice
+from app.queries import fetch_device_topology
+
+
+@pytest.fixture()
+def session():
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+def _device(name: str, device_type: DeviceType, parent_device_id=None) -> NetworkDevice:
+    return NetworkDevice(
+        name=name,
+        device_type=device_type,
+        ip_address="10.0.0.1",
+        location="Rack 1",
+        parent_device_id=parent_device_id,
+    )
+
+
+def test_fetch_device_topology_builds_nested_tree(session):
+    olt = _device("olt-1", DeviceType.OLT)
+    session.add(olt)
+    session.commit()
+    odc = _device("odc-1", DeviceType.ODC, parent_device_id=olt.id)
+    session.add(odc)
+    session.commit()
+    odp = _device("odp-1", DeviceType.ODP, parent_device_id=odc.id)
+    sibling = _device("olt-2", DeviceType.OLT)
+    session.add(odp)
+    session.add(sibling)
+    session.commit()
+    assert olt.id is not None and odc.id is not None
+    session.add(DeviceConnection(from_device_id=olt.id, to_device_id=odc.id, connection_type="fiber"))
+    session.commit()
+
+    topology = fetch_device_topology(session, olt.id)
+
+    assert topology is not None
+    assert topology.device.name == "olt-1"
+    assert [child.device.name for child in topology.children] == ["odc-1"]
+    assert [child.device.name for child in topology.children[0].children] == ["odp-1"]
+    assert [connection.to_device_id for connection in topology.connections] == [odc.id]
+    # the sibling root is not part of the subtree
+    names = {topology.device.name, topology.children[0].device.name, topology.children[0].children[0].device.name}
+    assert "olt-2" not in names
+
+
+def test_fetch_device_topology_missing_root_returns_none(session):
+    assert fetch_device_topology(session, 999) is None
@@ -0,0 +1,38 @@
+"""Smoke tests for the msgspec wire schemas."""
+
+from decimal import Decimal
+
+import msgspec
+import pytest
+
+from app.models import ConnectionType, PaymentMethod, PaymentStatus, UserRole
+from app.schemas_fast import CustomerCreate, PaymentWebhook, UserCreate, decode, encode
+
+
+def test_decode_user_create():
+    payload = b'{"username": "admin", "email": "a@b.c", "password": "secret123", "full_name": "Admin"}'
+    user = decode(payload, UserCreate)
+    assert user.username == "admin"
+    assert user.role == UserRole.MONITORING
+
+
+def test_decode_rejects_invalid():
+    # password below min_length must be rejected
+    payload = b'{"username": "admin", "email": "a@b.c", "password": "short", "full_name": "Admin"}'
+    with pytest.raises(msgspec.ValidationError):
+        decode(payload, UserCreate)
+
+
+def test_decode_payment_webhook():
+    payload = b'{"payment_id": "pay-1", "status": "paid", "amount": "150000.00", "payment_method": "qris"}'
+    webhook = decode(payload, PaymentWebhook)
+    assert webhook.status == PaymentStatus.PAID
+    assert webhook.payment_method == PaymentMethod.QRIS
+    assert webhook.amount == Decimal("150000.00")
+
+
+def test_encode_round_trip():
+    customer = CustomerCreate(
+        customer_code="C001", name="Test", address="Street 1", connection_type=ConnectionType.PPPOE
+    )
+    assert decode(encode(customer), CustomerCreate) == customer
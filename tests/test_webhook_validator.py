@@ -0,0 +1,29 @@
+"""Tests for the compiled payment webhook validator."""
+
+from decimal import Decimal
+
+import fastjsonschema
+import pytest
+
+from app.models import PaymentMethod, PaymentStatus
+from app.webhook_validator import parse_payment_webhook, validate_payment_webhook
+
+
+def test_parse_valid_webhook():
+    webhook = parse_payment_webhook(
+        {"payment_id": "pay-1", "status": "paid", "amount": "150000.00", "payment_method": "qris"}
+    )
+    assert webhook.status is PaymentStatus.PAID
+    assert webhook.payment_method is PaymentMethod.QRIS
+    assert webhook.amount == Decimal("150000.00")
+    assert webhook.webhook_data == {}
+
+
+def test_rejects_missing_field():
+    with pytest.raises(fastjsonschema.JsonSchemaException):
+        validate_payment_webhook({"payment_id": "pay-1", "status": "paid", "amount": 1})
+
+
+def test_rejects_unknown_status():
+    with pytest.raises(fastjsonschema.JsonSchemaException):
+        validate_payment_webhook({"payment_id": "pay-1", "status": "refunded", "amount": 1, "payment_method": "qris"})